@@ -2,6 +2,7 @@
 
 import errno
 import os
+import stat
 from pathlib import Path
 from typing import Union
 
@@ -31,21 +32,15 @@ def fix_permission(path: Path):
         return
 
     mode = path.stat().st_mode
+    fixed_mode = mode
 
     if path.is_file():
-        mode |= FILE_PERMISSION_MASK
+        fixed_mode |= FILE_PERMISSION_MASK
     elif path.is_dir():
-        mode |= DIR_PERMISSION_MASK
+        fixed_mode |= DIR_PERMISSION_MASK
 
-    path.chmod(mode)
-
-
-def is_recursive_link(path: Path) -> bool:
-    try:
-        path.resolve()
-    except RuntimeError:
-        return True
-    return False
+    if fixed_mode != mode:
+        path.chmod(fixed_mode)
 
 
 def fix_symlink(path: Path, outdir: Path, task_result: TaskResult) -> Path:
@@ -56,7 +51,10 @@ def fix_symlink(path: Path, outdir: Path, task_result: TaskResult) -> Path:
     fully portable (no mention of the extraction directory in the link
     value).
     """
-    if is_recursive_link(path):
+    try:
+        # resolved only once, as it is also the target of relative symlinks
+        resolved_path = path.resolve()
+    except RuntimeError:
         logger.error("Symlink loop identified, removing", path=path)
         error_report = MaliciousSymlinkRemoved(
             link=path.as_posix(), target=path.readlink().as_posix()
@@ -75,7 +73,7 @@ def fix_symlink(path: Path, outdir: Path, task_result: TaskResult) -> Path:
     if target.is_absolute():
         target = Path(target.as_posix().lstrip("/"))
     else:
-        target = path.resolve()
+        target = resolved_path
 
     safe = is_safe_path(outdir, target)
 
@@ -93,25 +91,60 @@ def fix_symlink(path: Path, outdir: Path, task_result: TaskResult) -> Path:
     return path
 
 
+def _fix_directory_entry(
+    root: Path, name: str, root_fd: int, outdir: Path, task_result: TaskResult
+) -> bool:
+    """Fix the permissions or the symlink target of a single directory entry.
+
+    Calls are made relative to the parent directory's file descriptor.
+    Returns True if the entry is a directory that should be descended into.
+    """
+    mode = os.stat(name, dir_fd=root_fd, follow_symlinks=False).st_mode  # noqa: PTH116
+
+    if stat.S_ISLNK(mode):
+        fix_symlink(root / name, outdir, task_result)
+        return False
+
+    if stat.S_ISDIR(mode):
+        _add_permissions_at(name, mode, DIR_PERMISSION_MASK, root_fd)
+        return True
+
+    if stat.S_ISREG(mode):
+        _add_permissions_at(name, mode, FILE_PERMISSION_MASK, root_fd)
+    return False
+
+
+def _add_permissions_at(name: str, mode: int, mask: int, dir_fd: int):
+    # most extracted entries already have the permissions, skip the syscall for them
+    if mode & mask != mask:
+        os.chmod(name, mode | mask, dir_fd=dir_fd)  # noqa: PTH101
+
+
+def _raise_walk_error(error: OSError):
+    raise error
+
+
 def fix_extracted_directory(outdir: Path, task_result: TaskResult):
-    def _fix_extracted_directory(directory: Path):
-        if not directory.exists():
-            return
-        for path in (directory / p for p in os.listdir(directory)):
+    if not outdir.exists():
+        return
+
+    fix_permission(outdir)
+    # Walking with directory file descriptors lets the kernel look up each
+    # entry in its parent directory, instead of resolving the full path from
+    # the root for every stat and chmod call.
+    for root, dirs, files, root_fd in os.fwalk(outdir, onerror=_raise_walk_error):
+        root_path = Path(root)
+        subdirs = []
+        for name in (*dirs, *files):
             try:
-                fix_permission(path)
-                if path.is_symlink():
-                    fix_symlink(path, outdir, task_result)
-                    continue
-                if path.is_dir():
-                    _fix_extracted_directory(path)
+                if _fix_directory_entry(root_path, name, root_fd, outdir, task_result):
+                    subdirs.append(name)
             except OSError as e:
                 if e.errno == errno.ENAMETOOLONG:
                     continue
                 raise e from None
-
-    fix_permission(outdir)
-    _fix_extracted_directory(outdir)
+        # descend into real directories only, never through symlinks
+        dirs[:] = subdirs
 
 
 def carve_unknown_chunk(
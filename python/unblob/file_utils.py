@@ -301,9 +301,20 @@ def carve(carve_path: Path, file: File, start_offset: int, size: int):
     """Extract part of a file."""
     carve_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with carve_path.open("xb") as f:
-        for data in iterate_file(file, start_offset, size):
-            f.write(data)
+    # offsets come from parsed headers, and with a negative one the write
+    # loop below would spin forever on empty slices
+    if not 0 <= start_offset <= len(file):
+        raise SeekError(f"Carve start offset {start_offset} is outside of the file")
+
+    # Write slices of the memory map directly, so data is not copied
+    # to intermediate bytes objects and the file pointer is left alone.
+    # The file is unbuffered, so the whole chunk is handed to the kernel
+    # in as few write calls as possible.
+    with carve_path.open("xb", buffering=0) as f, memoryview(file) as data:
+        offset = start_offset
+        end_offset = min(start_offset + size, len(data))
+        while offset < end_offset:
+            offset += f.write(data[offset:end_offset])
 
 
 def stream_scan(scanner, file: File):
@@ -3,7 +3,7 @@
 The main "entry point" is search_chunks_by_priority.
 """
 
-from functools import lru_cache
+from functools import cache
 from typing import Optional
 
 import attrs
@@ -169,7 +169,7 @@ def search_chunks(
     return all_chunks
 
 
-@lru_cache
+@cache
 def build_hyperscan_database(handlers: Handlers) -> StreamDatabase:
     patterns = []
     for handler_class in handlers:
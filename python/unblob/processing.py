@@ -1,3 +1,4 @@
+import mmap
 import multiprocessing
 import shutil
 from collections.abc import Iterable, Sequence
@@ -7,7 +8,6 @@ from typing import Optional, Union
 
 import attrs
 import magic
-import plotext as plt
 from structlog import get_logger
 
 from unblob import math_tools as mt
@@ -15,8 +15,7 @@ from unblob.handlers import BUILTIN_DIR_HANDLERS, BUILTIN_HANDLERS, Handlers
 
 from .extractor import carve_unknown_chunk, carve_valid_chunk, fix_extracted_directory
 from .file_utils import InvalidInputFormat, iterate_file
-from .finder import search_chunks
-from .iter_utils import pairwise
+from .finder import build_hyperscan_database, search_chunks
 from .logging import noformat
 from .models import (
     Chunk,
@@ -167,6 +166,15 @@ def _process_task(config: ExtractionConfig, task: Task) -> ProcessResult:
             pool.submit(new_task)
         aggregated_result.register(result)
 
+    # Compile the pattern database before the workers are forked, so they
+    # inherit it instead of compiling it again in every worker process.
+    # Failures are left to the per task path, where they end up in the report;
+    # invalid patterns are logged by both compile attempts.
+    try:
+        build_hyperscan_database(config.handlers)
+    except Exception:
+        logger.debug("Pattern database warm-up failed", exc_info=True)
+
     pool = make_pool(
         process_num=config.process_num,
         handler=processor.process_task,
@@ -236,6 +244,8 @@ class Processor:
         # accuracy by no shadowing rules.
         self._get_magic = magic.Magic(keep_going=True).from_file
         self._get_mime_type = magic.Magic(mime=True).from_file
+        # str.startswith checks all prefixes of a tuple in a single call
+        self._skip_magic = tuple(config.skip_magic)
 
     def process_task(self, task: Task) -> TaskResult:
         result = TaskResult(task)
@@ -291,9 +301,7 @@ class Processor:
             log.debug("Ignoring empty file")
             return
 
-        should_skip_file = any(
-            magic.startswith(pattern) for pattern in self._config.skip_magic
-        )
+        should_skip_file = magic.startswith(self._skip_magic)
         should_skip_file |= task.path.suffix in self._config.skip_extension
 
         if should_skip_file:
@@ -672,11 +680,25 @@ def remove_inner_chunks(chunks: list[ValidChunk]) -> list[ValidChunk]:
     if not chunks:
         return []
 
-    chunks_by_size = sorted(chunks, key=attrgetter("size"), reverse=True)
-    outer_chunks = [chunks_by_size[0]]
-    for chunk in chunks_by_size[1:]:
-        if not any(outer.contains(chunk) for outer in outer_chunks):
-            outer_chunks.append(chunk)
+    # Sweep through the chunks by start offset, longer ones first on a tie.
+    # A chunk is inside another one exactly when an earlier chunk ends after it,
+    # or ends together with it but starts before it.
+    chunks_by_offset = sorted(
+        chunks, key=lambda chunk: (chunk.start_offset, -chunk.end_offset)
+    )
+    outer_chunks = []
+    max_end_offset = -1
+    max_end_start_offset = -1
+    for chunk in chunks_by_offset:
+        if chunk.end_offset < max_end_offset or (
+            chunk.end_offset == max_end_offset
+            and max_end_start_offset < chunk.start_offset
+        ):
+            continue
+        outer_chunks.append(chunk)
+        if chunk.end_offset > max_end_offset:
+            max_end_offset = chunk.end_offset
+            max_end_start_offset = chunk.start_offset
 
     outer_count = len(outer_chunks)
     removed_count = len(chunks) - outer_count
@@ -705,7 +727,8 @@ def calculate_unknown_chunks(
         unknown_chunk = UnknownChunk(start_offset=0, end_offset=first.start_offset)
         unknown_chunks.append(unknown_chunk)
 
-    for chunk, next_chunk in pairwise(sorted_by_offset):
+    chunk = first
+    for next_chunk in sorted_by_offset[1:]:
         diff = next_chunk.start_offset - chunk.end_offset
         if diff != 0:
             unknown_chunk = UnknownChunk(
@@ -713,6 +736,7 @@ def calculate_unknown_chunks(
                 end_offset=next_chunk.start_offset,
             )
             unknown_chunks.append(unknown_chunk)
+        chunk = next_chunk
 
     last = sorted_by_offset[-1]
     if last.end_offset < file_size:
@@ -757,6 +781,8 @@ def calculate_randomness(path: Path) -> RandomnessReport:
     shannon_entropy_sum = 0.0
     chisquare_probability_sum = 0.0
     with File.from_path(path) as file:
+        # the file is read through once from start to end, let the kernel read ahead
+        file.madvise(mmap.MADV_SEQUENTIAL)
         for chunk in iterate_file(file, 0, file_size, buffer_size=block_size):
             shannon_entropy = mt.shannon_entropy(chunk)
             shannon_entropy_percentage = round(shannon_entropy / 8 * 100, 2)
@@ -815,6 +841,9 @@ def calculate_block_size(
 
 
 def format_randomness_plot(report: RandomnessReport):
+    # imported on demand, as plots are only drawn with the highest verbosity
+    import plotext as plt
+
     # start from scratch
     plt.clear_figure()
     # go colorless
@@ -3,6 +3,7 @@ from pathlib import Path, PosixPath
 
 import pytest
 
+from unblob import extractor
 from unblob.extractor import (
     DIR_PERMISSION_MASK,
     FILE_PERMISSION_MASK,
@@ -12,6 +13,7 @@ from unblob.extractor import (
     fix_symlink,
 )
 from unblob.models import File, TaskResult, UnknownChunk
+from unblob.report import MaliciousSymlinkRemoved
 
 
 def test_carve_unknown_chunk(tmp_path: Path):
@@ -68,6 +70,74 @@ def test_fix_extracted_directory(tmpdir: Path, task_result: TaskResult):
     assert (tmpfile.stat().st_mode & 0o777) == 0o644
 
 
+def test_fix_extracted_directory_unreadable_subdirs(
+    tmp_path: Path, task_result: TaskResult
+):
+    outdir = tmp_path / "outdir"
+    inner_dir = outdir / "locked" / "inner"
+    inner_dir.mkdir(parents=True)
+    files = [outdir / "locked" / "file.txt", inner_dir / "file.txt"]
+    for file in files:
+        file.touch()
+        file.chmod(0o200)
+    inner_dir.chmod(0o300)
+    inner_dir.parent.chmod(0o300)
+
+    fix_extracted_directory(outdir, task_result)
+
+    for directory in (outdir, inner_dir.parent, inner_dir):
+        assert (directory.stat().st_mode & 0o777) == 0o775
+    for file in files:
+        assert (file.stat().st_mode & 0o777) == 0o644
+    assert task_result.reports == []
+
+
+def test_fix_extracted_directory_symlinks(
+    tmp_path: Path, task_result: TaskResult, monkeypatch: pytest.MonkeyPatch
+):
+    outdir = tmp_path / "outdir"
+    subdir = outdir / "subdir"
+    subdir.mkdir(parents=True)
+    (subdir / "file.txt").touch()
+    (subdir / "abs_link").symlink_to("/subdir/file.txt")
+    (outdir / "dir_link").symlink_to("subdir")
+    (outdir / "dir_link_abs").symlink_to("/subdir")
+
+    outside_dir = tmp_path / "outside"
+    outside_dir.mkdir()
+    outside_file = outside_dir / "file.txt"
+    outside_file.touch()
+    outside_file.chmod(0o200)
+    (outdir / "outside_link").symlink_to("../outside")
+
+    fixed_links = []
+
+    def recording_fix_symlink(path: Path, outdir: Path, task_result: TaskResult):
+        fixed_links.append(path)
+        return fix_symlink(path, outdir, task_result)
+
+    monkeypatch.setattr(extractor, "fix_symlink", recording_fix_symlink)
+
+    fix_extracted_directory(outdir, task_result)
+
+    # every link is fixed exactly once, and none of them is walked through
+    assert sorted(fixed_links) == [
+        outdir / "dir_link",
+        outdir / "dir_link_abs",
+        outdir / "outside_link",
+        subdir / "abs_link",
+    ]
+    assert (outside_file.stat().st_mode & 0o777) == 0o200
+
+    assert (outdir / "dir_link").readlink() == Path("subdir")
+    assert (outdir / "dir_link_abs").readlink() == Path("subdir")
+    assert (subdir / "abs_link").readlink() == Path("file.txt")
+    assert not (outdir / "outside_link").is_symlink()
+    [report] = task_result.reports
+    assert isinstance(report, MaliciousSymlinkRemoved)
+    assert report.link == (outdir / "outside_link").as_posix()
+
+
 def test_fix_recursive_symlink(tmpdir: Path, task_result: TaskResult):
     tmpdir = PosixPath(tmpdir)
     link_path = tmpdir / Path("link_a")
@@ -5,11 +5,14 @@ from pathlib import Path
 import pytest
 
 from unblob.file_utils import (
+    DEFAULT_BUFSIZE,
     Endian,
     File,
     FileSystem,
     InvalidInputFormat,
+    SeekError,
     StructParser,
+    carve,
     chop_root,
     convert_int8,
     convert_int16,
@@ -340,6 +343,53 @@ def test_iterate_file_errors(
         list(iterate_file(file, start_offset, size, buffer_size))
 
 
+@pytest.mark.parametrize(
+    "start_offset, size",
+    [
+        pytest.param(0, 10, id="whole_small"),
+        pytest.param(3, 4, id="middle"),
+        pytest.param(1, DEFAULT_BUFSIZE * 2 + 5, id="large_chunk"),
+        pytest.param(DEFAULT_BUFSIZE * 4 - 2, 2, id="until_end_of_file"),
+    ],
+)
+def test_carve(tmp_path: Path, start_offset: int, size: int):
+    content = bytes(range(256)) * (DEFAULT_BUFSIZE // 64)
+    file = File.from_bytes(content)
+    file.seek(42)
+
+    carve_path = tmp_path / "carved"
+    carve(carve_path, file, start_offset, size)
+
+    assert carve_path.read_bytes() == content[start_offset : start_offset + size]
+    assert file.tell() == 42
+
+
+def test_carve_truncated_at_end_of_file(tmp_path: Path):
+    file = File.from_bytes(b"0123456789")
+
+    carve_path = tmp_path / "carved"
+    carve(carve_path, file, 7, 5)
+
+    assert carve_path.read_bytes() == b"789"
+
+
+@pytest.mark.parametrize(
+    "start_offset",
+    [
+        pytest.param(20, id="past_end_of_file"),
+        pytest.param(-1, id="negative"),
+    ],
+)
+def test_carve_invalid_start_offset(tmp_path: Path, start_offset: int):
+    file = File.from_bytes(b"0123456789")
+
+    carve_path = tmp_path / "carved"
+    with pytest.raises(SeekError):
+        carve(carve_path, file, start_offset, 5)
+
+    assert not carve_path.exists()
+
+
 class TestGetEndian:
     @pytest.mark.parametrize(
         "content, big_endian_magic, expected",
@@ -118,6 +118,27 @@ def assert_same_chunks(expected, actual, explanation=None):
             ],
             "Multiple outer chunks, with chunks inside",
         ),
+        (
+            [
+                ValidChunk(start_offset=5, end_offset=10),
+                ValidChunk(start_offset=0, end_offset=10),
+                ValidChunk(start_offset=0, end_offset=3),
+            ],
+            [ValidChunk(start_offset=0, end_offset=10)],
+            "Chunks sharing the start or end offset of the outer chunk",
+        ),
+        (
+            [
+                ValidChunk(start_offset=4, end_offset=12),
+                ValidChunk(start_offset=0, end_offset=8),
+                ValidChunk(start_offset=5, end_offset=7),
+            ],
+            [
+                ValidChunk(start_offset=0, end_offset=8),
+                ValidChunk(start_offset=4, end_offset=12),
+            ],
+            "Overlapping outer chunks are kept",
+        ),
     ],
 )
 def test_remove_inner_chunks(
@@ -366,6 +387,20 @@ def test_process_file_prevents_double_extracts(tmp_path: Path, fw: Path):
     assert extracted_extracted_fw_paths == [Path("."), *extracted_fw_paths]
 
 
+def test_process_file_reports_pattern_database_error(tmp_path: Path):
+    input_file = tmp_path / "input"
+    input_file.write_bytes(b"content")
+
+    # an empty handler list cannot be compiled into a pattern database
+    config = ExtractionConfig(
+        extract_root=tmp_path / "extract_root", randomness_depth=0, handlers=()
+    )
+    process_result = process_file(config, input_file)
+
+    [report] = process_result.errors
+    assert isinstance(report, UnknownError)
+
+
 @pytest.mark.skipif(
     platform.system() == "Darwin", reason="non-POSIX path not supported"
 )
@@ -7,7 +7,7 @@ import unblob.plugins
 from unblob import cli
 from unblob.file_utils import File, FileSystem, iterbits, round_down
 from unblob.handlers.compression.lzo import HeaderFlags as LZOHeaderFlags
-from unblob.models import SingleFile, TaskResult, _JSONEncoder
+from unblob.models import Chunk, SingleFile, TaskResult, _JSONEncoder
 from unblob.parser import _HexStringToRegex
 from unblob.report import ChunkReport, FileMagicReport, StatReport
 
@@ -19,6 +19,7 @@ _HexStringToRegex.alternative
 
 _JSONEncoder.default
 
+Chunk.contains
 TaskResult.filter_reports
 ChunkReport.handler_name
 FileMagicReport.magic